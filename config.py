@@ -2,3 +2,9 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
 GRAVITY = 0.5
+
+# Cell size (in pixels) of the broad-phase collision grid
+GRID_CELL_SIZE = 64
+
+# Most game ticks caught up per drawn frame; past this the game slows down
+MAX_TICKS_PER_FRAME = 5
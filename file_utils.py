@@ -0,0 +1,29 @@
+"""Small file helpers shared by the game's save files."""
+import os
+import tempfile
+
+
+def atomic_write_text(filename, text):
+    """Replace a file's contents without ever leaving it half-written.
+    
+    The text goes to a temporary file in the same directory, which then
+    replaces the target. The target keeps its permissions; a new file gets
+    the usual 0o666 minus the umask.
+    """
+    try:
+        mode = os.stat(filename).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(filename)),
+                                     suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, filename)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
@@ -1,120 +1,371 @@
 """Level management, loading, and collision detection."""
+import math
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional
+
 import pygame
+from config import GRID_CELL_SIZE
+
+
+def circle_rect_collision(cx, cy, radius, rect_cx, rect_cy, half_w, half_h):
+    """Return True if a circle overlaps an axis-aligned rectangle.
+    
+    The rectangle is given by its centre and half-extents, which callers
+    precompute since they only change when the rectangle moves.
+    """
+    dx = abs(cx - rect_cx)
+    dy = abs(cy - rect_cy)
+    
+    if dx > half_w + radius or dy > half_h + radius:
+        return False
+    if dx <= half_w or dy <= half_h:
+        return True
+    
+    corner_x = dx - half_w
+    corner_y = dy - half_h
+    return corner_x * corner_x + corner_y * corner_y <= radius * radius
+
+
+@dataclass(frozen=True)
+class PlatformDef:
+    """Immutable description of a platform as laid out in a level."""
+    x: int
+    y: int
+    width: int
+    height: int
+    color: tuple
+    kind: Optional[str] = None  # None, 'water' or 'moving'
+    start_x: Optional[int] = None
+    end_x: Optional[int] = None
+    speed: int = 1
+
+
+@dataclass(frozen=True)
+class EnemyDef:
+    """Immutable description of an enemy as laid out in a level."""
+    x: int
+    y: int
+    width: int
+    height: int
+    color: tuple
+    patrol: Optional[tuple] = None
+
+
+@dataclass(frozen=True)
+class GoalDef:
+    """The goal area of a level; never moves, so it is used as-is."""
+    x: int
+    y: int
+    width: int
+    height: int
+    color: tuple
+
+
+@dataclass(frozen=True)
+class LevelDef:
+    """Immutable template for a whole level."""
+    platforms: tuple
+    enemies: tuple
+    goal: Optional[GoalDef]
+    start_pos: tuple
+    background: tuple
+
+
+# Level templates, built once at import and shared by every LevelManager.
+LEVEL_DEFS = MappingProxyType({
+    # Level 1: Basic platforms
+    1: LevelDef(
+        platforms=(
+            PlatformDef(0, 500, 300, 20, (0, 200, 0)),
+            PlatformDef(400, 500, 400, 20, (0, 200, 0)),
+            PlatformDef(200, 400, 200, 20, (0, 200, 0)),
+            PlatformDef(500, 300, 200, 20, (0, 200, 0)),
+            PlatformDef(100, 200, 200, 20, (0, 200, 0)),
+        ),
+        enemies=(),
+        goal=GoalDef(150, 150, 50, 50, (255, 215, 0)),
+        start_pos=(100, 50),
+        background=(135, 206, 235),  # Sky blue
+    ),
+    
+    # Level 2: Water level with floating platforms
+    2: LevelDef(
+        platforms=(
+            # Ground
+            PlatformDef(0, 550, 800, 50, (139, 69, 19)),
+            # Floating platforms
+            PlatformDef(100, 450, 100, 20, (0, 200, 0)),
+            PlatformDef(300, 400, 100, 20, (0, 200, 0)),
+            PlatformDef(500, 350, 100, 20, (0, 200, 0)),
+            # Water surface
+            PlatformDef(0, 500, 800, 50, (64, 164, 223), kind='water'),
+            # Exit platform
+            PlatformDef(650, 300, 100, 20, (200, 0, 0)),
+        ),
+        enemies=(
+            EnemyDef(200, 430, 30, 20, (255, 0, 0), patrol=(150, 250)),
+        ),
+        goal=GoalDef(675, 250, 50, 50, (255, 215, 0)),
+        start_pos=(150, 400),
+        background=(100, 149, 237),  # Cornflower blue
+    ),
+    
+    # Level 3: More complex with moving platforms and enemies
+    3: LevelDef(
+        platforms=(
+            # Ground with gaps
+            PlatformDef(0, 550, 200, 50, (139, 69, 19)),
+            PlatformDef(300, 550, 200, 50, (139, 69, 19)),
+            PlatformDef(600, 550, 200, 50, (139, 69, 19)),
+            # Platforms
+            PlatformDef(100, 450, 100, 20, (0, 200, 0)),
+            PlatformDef(300, 400, 100, 20, (0, 200, 0)),
+            PlatformDef(500, 350, 100, 20, (0, 200, 0)),
+            # Moving platform
+            PlatformDef(200, 300, 100, 20, (0, 200, 0), kind='moving',
+                        start_x=200, end_x=400, speed=1),
+            # Exit platform
+            PlatformDef(650, 200, 100, 20, (200, 0, 0)),
+        ),
+        enemies=(
+            EnemyDef(400, 530, 30, 20, (255, 0, 0), patrol=(350, 450)),
+            EnemyDef(600, 400, 30, 20, (255, 0, 0), patrol=(550, 650)),
+        ),
+        goal=GoalDef(675, 150, 50, 50, (255, 215, 0)),
+        start_pos=(100, 400),
+        background=(47, 79, 79),  # Dark slate gray
+    ),
+})
+
+
+class Platform:
+    """Live state of a platform in the current level."""
+    __slots__ = ('x', 'y', 'width', 'height', 'color', 'kind',
+                 'speed', 'start_x', 'end_x', 'is_water', 'is_moving')
+    
+    def __init__(self, definition):
+        self.x = definition.x
+        self.y = definition.y
+        self.width = definition.width
+        self.height = definition.height
+        self.color = definition.color
+        self.kind = definition.kind
+        self.speed = definition.speed
+        self.start_x = definition.x - 100 if definition.start_x is None else definition.start_x
+        self.end_x = definition.x + 100 if definition.end_x is None else definition.end_x
+        # Resolved once so level-load filters don't compare strings
+        self.is_water = definition.kind == 'water'
+        self.is_moving = definition.kind == 'moving'
+
+
+class Enemy:
+    """Live state of an enemy, optionally patrolling between two x positions."""
+    __slots__ = ('x', 'y', 'width', 'height', 'color', 'speed',
+                 'patrol_lo', 'patrol_hi', 'half_w', 'half_h', 'center_y')
+    
+    def __init__(self, definition):
+        self.x = definition.x
+        self.y = definition.y
+        self.width = definition.width
+        self.height = definition.height
+        self.color = definition.color
+        self.speed = 1
+        self.patrol_lo, self.patrol_hi = definition.patrol or (None, None)
+        # Only x changes while patrolling, so the rest of the collision
+        # geometry is fixed for the enemy's lifetime
+        self.half_w = definition.width / 2
+        self.half_h = definition.height / 2
+        self.center_y = definition.y + self.half_h
+
 
 class LevelManager:
     def __init__(self):
         self.levels = {}
         self.current_level = 0
+        self._level_def = None
         self.platforms = []
         self.enemies = []
         self.goal = None
+        self._moving_platforms = []
+        self._water_bounds = []
+        # Broad-phase grid: (cell_x, cell_y) -> platform indices
+        self._grid = {}
+        self._platform_cells = []
+        # Packed (left, top, right, bottom) bounds, one per platform
+        self._platform_aabbs = []
+        # Pre-built draw rects, kept in sync with moving entities
+        self._platform_rects = []
+        self._platform_colors = []
+        self._enemy_rects = []
+        self._goal_rect = None
+        # Background plus static geometry, baked on first render of a level
+        self._static_bg = None
+        # (surface, live rect) pairs for everything that moves
+        self._dynamic_sprites = []
+        # Goal centre, half-extents and half-diagonal
+        self._goal_center = (0, 0)
+        self._goal_half = (0, 0)
+        self._goal_extent = 0
         self.load_levels()
     
     def load_levels(self):
-        """Define the three levels of the game."""
-        # Level 1: Basic platforms
-        self.levels[1] = {
-            'platforms': [
-                {'x': 0, 'y': 500, 'width': 300, 'height': 20, 'color': (0, 200, 0)},
-                {'x': 400, 'y': 500, 'width': 400, 'height': 20, 'color': (0, 200, 0)},
-                {'x': 200, 'y': 400, 'width': 200, 'height': 20, 'color': (0, 200, 0)},
-                {'x': 500, 'y': 300, 'width': 200, 'height': 20, 'color': (0, 200, 0)},
-                {'x': 100, 'y': 200, 'width': 200, 'height': 20, 'color': (0, 200, 0)}
-            ],
-            'enemies': [],
-            'goal': {'x': 150, 'y': 150, 'width': 50, 'height': 50, 'color': (255, 215, 0)},
-            'start_pos': (100, 50),
-            'background': (135, 206, 235)  # Sky blue
-        }
+        """Bind the shared, read-only level templates."""
+        self.levels = LEVEL_DEFS
+    
+    def load_level(self, level_num):
+        """Load a specific level.
         
-        # Level 2: Water level with floating platforms
-        self.levels[2] = {
-            'platforms': [
-                # Ground
-                {'x': 0, 'y': 550, 'width': 800, 'height': 50, 'color': (139, 69, 19)},
-                # Floating platforms
-                {'x': 100, 'y': 450, 'width': 100, 'height': 20, 'color': (0, 200, 0)},
-                {'x': 300, 'y': 400, 'width': 100, 'height': 20, 'color': (0, 200, 0)},
-                {'x': 500, 'y': 350, 'width': 100, 'height': 20, 'color': (0, 200, 0)},
-                # Water surface
-                {'x': 0, 'y': 500, 'width': 800, 'height': 50, 'color': (64, 164, 223), 'type': 'water'},
-                # Exit platform
-                {'x': 650, 'y': 300, 'width': 100, 'height': 20, 'color': (200, 0, 0)}
-            ],
-            'enemies': [
-                {'x': 200, 'y': 430, 'width': 30, 'height': 20, 'color': (255, 0, 0), 'patrol': [150, 250]}
-            ],
-            'goal': {'x': 675, 'y': 250, 'width': 50, 'height': 50, 'color': (255, 215, 0)},
-            'start_pos': (150, 400),
-            'background': (100, 149, 237)  # Cornflower blue
-        }
+        Platforms and enemies are copied out of the template so moving
+        state starts fresh on every load.
+        """
+        try:
+            level_def = self.levels[level_num]
+        except KeyError:
+            return None
         
-        # Level 3: More complex with moving platforms and enemies
-        self.levels[3] = {
-            'platforms': [
-                # Ground with gaps
-                {'x': 0, 'y': 550, 'width': 200, 'height': 50, 'color': (139, 69, 19)},
-                {'x': 300, 'y': 550, 'width': 200, 'height': 50, 'color': (139, 69, 19)},
-                {'x': 600, 'y': 550, 'width': 200, 'height': 50, 'color': (139, 69, 19)},
-                # Platforms
-                {'x': 100, 'y': 450, 'width': 100, 'height': 20, 'color': (0, 200, 0)},
-                {'x': 300, 'y': 400, 'width': 100, 'height': 20, 'color': (0, 200, 0)},
-                {'x': 500, 'y': 350, 'width': 100, 'height': 20, 'color': (0, 200, 0)},
-                # Moving platform
-                {'x': 200, 'y': 300, 'width': 100, 'height': 20, 'color': (0, 200, 0), 'type': 'moving', 'start_x': 200, 'end_x': 400, 'speed': 1},
-                # Exit platform
-                {'x': 650, 'y': 200, 'width': 100, 'height': 20, 'color': (200, 0, 0)}
-            ],
-            'enemies': [
-                {'x': 400, 'y': 530, 'width': 30, 'height': 20, 'color': (255, 0, 0), 'patrol': [350, 450]},
-                {'x': 600, 'y': 400, 'width': 30, 'height': 20, 'color': (255, 0, 0), 'patrol': [550, 650]}
-            ],
-            'goal': {'x': 675, 'y': 150, 'width': 50, 'height': 50, 'color': (255, 215, 0)},
-            'start_pos': (100, 400),
-            'background': (47, 79, 79)  # Dark slate gray
-        }
+        self.current_level = level_num
+        self._level_def = level_def
+        self.platforms = [Platform(p) for p in level_def.platforms]
+        self.enemies = [Enemy(e) for e in level_def.enemies]
+        self.goal = level_def.goal
+        self._moving_platforms = [(index, p) for index, p in enumerate(self.platforms)
+                                  if p.is_moving]
+        self._water_bounds = [(p.x, p.y, p.x + p.width, p.y + p.height)
+                              for p in self.platforms if p.is_water]
+        self._platform_aabbs = [(p.x, p.y, p.x + p.width, p.y + p.height)
+                                for p in self.platforms]
+        if self.goal:
+            half_w = self.goal.width / 2
+            half_h = self.goal.height / 2
+            self._goal_center = (self.goal.x + half_w, self.goal.y + half_h)
+            self._goal_half = (half_w, half_h)
+            self._goal_extent = math.hypot(half_w, half_h)
+        self._build_grid()
+        self._build_rects()
+        self._static_bg = None
+        return level_def.start_pos
     
-    def load_level(self, level_num):
-        """Load a specific level."""
-        if level_num in self.levels:
-            self.current_level = level_num
-            level_data = self.levels[level_num]
-            self.platforms = level_data['platforms']
-            self.enemies = level_data['enemies']
-            self.goal = level_data['goal']
-            return level_data['start_pos']
-        return None
+    def _build_rects(self):
+        """Create the Rect objects used to draw the current level."""
+        self._platform_rects = [pygame.Rect(p.x, p.y, p.width, p.height)
+                                for p in self.platforms]
+        self._platform_colors = [p.color for p in self.platforms]
+        self._enemy_rects = [pygame.Rect(e.x, e.y, e.width, e.height)
+                             for e in self.enemies]
+        if self.goal:
+            self._goal_rect = pygame.Rect(self.goal.x, self.goal.y,
+                                          self.goal.width, self.goal.height)
+        else:
+            self._goal_rect = None
+    
+    def _cell_range(self, x, y, width, height):
+        """Return the (x0, y0, x1, y1) grid cells covered by a rectangle."""
+        return (int(x // GRID_CELL_SIZE), int(y // GRID_CELL_SIZE),
+                int((x + width) // GRID_CELL_SIZE), int((y + height) // GRID_CELL_SIZE))
+    
+    def _insert_platform(self, index, cells):
+        """Add a platform index to every grid cell in the given range."""
+        x0, y0, x1, y1 = cells
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                self._grid.setdefault((cell_x, cell_y), []).append(index)
+    
+    def _remove_platform(self, index, cells):
+        """Remove a platform index from every grid cell in the given range."""
+        x0, y0, x1, y1 = cells
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                self._grid[(cell_x, cell_y)].remove(index)
+    
+    def _build_grid(self):
+        """Bucket the current level's platforms into the broad-phase grid."""
+        self._grid = {}
+        self._platform_cells = []
+        for index, platform in enumerate(self.platforms):
+            cells = self._cell_range(platform.x, platform.y,
+                                     platform.width, platform.height)
+            self._platform_cells.append(cells)
+            self._insert_platform(index, cells)
+    
+    def _update_grid_cell(self, index):
+        """Re-bucket a moved platform, only if it crossed a cell boundary."""
+        platform = self.platforms[index]
+        cells = self._cell_range(platform.x, platform.y,
+                                 platform.width, platform.height)
+        if cells != self._platform_cells[index]:
+            self._remove_platform(index, self._platform_cells[index])
+            self._insert_platform(index, cells)
+            self._platform_cells[index] = cells
+    
+    def query_platforms(self, rect):
+        """Return indices of platforms near an (x, y, width, height) rect.
+        
+        Indices are returned in level order so collision response stays
+        the same as when scanning every platform.
+        """
+        x0, y0, x1, y1 = self._cell_range(*rect)
+        found = set()
+        for cell_x in range(x0, x1 + 1):
+            for cell_y in range(y0, y1 + 1):
+                found.update(self._grid.get((cell_x, cell_y), ()))
+        return sorted(found)
+    
+    def nearby_platform_bounds(self, rect):
+        """Return the (left, top, right, bottom) bounds of platforms near a rect.
+        
+        Same platforms and order as query_platforms, as one flat list.
+        """
+        aabbs = self._platform_aabbs
+        return [aabbs[index] for index in self.query_platforms(rect)]
     
     def update(self, player):
         """Update level elements like moving platforms and enemies."""
-        # Update moving platforms
-        for platform in self.platforms:
-            if platform.get('type') == 'moving':
-                platform['x'] += platform.get('speed', 1)
-                if platform['x'] > platform.get('end_x', platform['x'] + 100):
-                    platform['x'] = platform['end_x']
-                    platform['speed'] *= -1
-                elif platform['x'] < platform.get('start_x', platform['x'] - 100):
-                    platform['x'] = platform['start_x']
-                    platform['speed'] *= -1
+        # Update moving platforms, clamping to the track and flipping at the ends
+        for index, platform in self._moving_platforms:
+            new_x = platform.x + platform.speed
+            platform.x = max(platform.start_x, min(platform.end_x, new_x))
+            platform.speed = -platform.speed if platform.x != new_x else platform.speed
+            self._platform_aabbs[index] = (platform.x, platform.y,
+                                           platform.x + platform.width,
+                                           platform.y + platform.height)
+            self._update_grid_cell(index)
+            self._platform_rects[index].x = platform.x
         
-        # Update enemies
-        for enemy in self.enemies:
-            if 'patrol' in enemy:
-                enemy['x'] += enemy.get('speed', 1)
-                if enemy['x'] > enemy['patrol'][1]:
-                    enemy['x'] = enemy['patrol'][1]
-                    enemy['speed'] = -1
-                elif enemy['x'] < enemy['patrol'][0]:
-                    enemy['x'] = enemy['patrol'][0]
-                    enemy['speed'] = 1
+        # Update enemies the same way along their patrol range, testing each
+        # against the player while its data is already at hand
+        px, py = player.x, player.y
+        radius = player.size
+        radius_sq = radius * radius
+        hit_enemy = False
+        for enemy, rect in zip(self.enemies, self._enemy_rects):
+            if enemy.patrol_lo is not None:
+                new_x = enemy.x + enemy.speed
+                enemy.x = max(enemy.patrol_lo, min(enemy.patrol_hi, new_x))
+                enemy.speed = -enemy.speed if enemy.x != new_x else enemy.speed
+                rect.x = enemy.x
+            if hit_enemy:
+                continue
+            
+            # Same test as circle_rect_collision, inlined so a level full of
+            # enemies costs no extra Python call per enemy
+            half_w = enemy.half_w
+            half_h = enemy.half_h
+            dx = abs(px - (enemy.x + half_w))
+            dy = abs(py - enemy.center_y)
+            if dx > half_w + radius or dy > half_h + radius:
+                continue
+            if dx <= half_w or dy <= half_h:
+                hit_enemy = True
+                continue
+            corner_x = dx - half_w
+            corner_y = dy - half_h
+            hit_enemy = corner_x * corner_x + corner_y * corner_y <= radius_sq
         
-        # Check for goal collision
+        # Reaching the goal wins over touching an enemy on the same frame
         if self.check_goal_collision(player):
             return 'level_complete'
-            
-        # Check for enemy collision
-        if self.check_enemy_collision(player):
+        if hit_enemy:
             return 'player_dead'
             
         return None
@@ -123,67 +374,59 @@ class LevelManager:
         """Check if player has reached the goal."""
         if not self.goal:
             return False
-            
-        # Simple circle-rectangle collision
-        dx = abs(player.x - (self.goal['x'] + self.goal['width']/2))
-        dy = abs(player.y - (self.goal['y'] + self.goal['height']/2))
         
-        if (dx > (self.goal['width']/2 + player.customization['size'])):
-            return False
-        if (dy > (self.goal['height']/2 + player.customization['size'])):
+        # Far from the goal's bounding circle: skip the exact test
+        radius = player.size
+        dx = player.x - self._goal_center[0]
+        dy = player.y - self._goal_center[1]
+        reach = self._goal_extent + radius
+        if dx * dx + dy * dy > reach * reach:
             return False
-            
-        if (dx <= (self.goal['width']/2)) or (dy <= (self.goal['height']/2)):
-            return True
-            
-        corner_dist = (dx - self.goal['width']/2)**2 + (dy - self.goal['height']/2)**2
-        return corner_dist <= (player.customization['size'] ** 2)
-    
-    def check_enemy_collision(self, player):
-        """Check if player has collided with an enemy."""
-        for enemy in self.enemies:
-            # Simple circle-rectangle collision
-            dx = abs(player.x - (enemy['x'] + enemy['width']/2))
-            dy = abs(player.y - (enemy['y'] + enemy['height']/2))
-            
-            if (dx > (enemy['width']/2 + player.customization['size'])):
-                continue
-            if (dy > (enemy['height']/2 + player.customization['size'])):
-                continue
-                
-            if (dx <= (enemy['width']/2)) or (dy <= (enemy['height']/2)):
-                return True
-                
-            corner_dist = (dx - enemy['width']/2)**2 + (dy - enemy['height']/2)**2
-            if corner_dist <= (player.customization['size'] ** 2):
-                return True
-                
-        return False
+        
+        return circle_rect_collision(player.x, player.y, radius,
+                                     self._goal_center[0], self._goal_center[1],
+                                     self._goal_half[0], self._goal_half[1])
     
-    def get_water_platforms(self):
-        """Get all water platforms for water physics."""
-        return [p for p in self.platforms if p.get('type') == 'water']
+    def is_in_water(self, x, y):
+        """Return True if the point (x, y) lies inside any water platform."""
+        return any(left <= x <= right and top <= y <= bottom
+                   for left, top, right, bottom in self._water_bounds)
+    
+    def _bake_static_background(self, screen):
+        """Bake the static scenery and build sprites for moving entities."""
+        background = pygame.Surface(screen.get_size()).convert(screen)
+        background.fill(self._level_def.background)
+        
+        moving = {index for index, _ in self._moving_platforms}
+        for index, (color, rect) in enumerate(zip(self._platform_colors, self._platform_rects)):
+            if index not in moving:
+                background.fill(color, rect)
+        
+        if self._goal_rect:
+            background.fill(self.goal.color, self._goal_rect)
+        
+        self._static_bg = background
+        
+        # Solid sprites for moving entities, paired with the Rects that
+        # update() keeps in sync, so a frame draws them in one blits() call
+        dynamic = [(platform.color, self._platform_rects[index])
+                   for index, platform in self._moving_platforms]
+        dynamic += [(enemy.color, rect) for enemy, rect in zip(self.enemies, self._enemy_rects)]
+        self._dynamic_sprites = []
+        for color, rect in dynamic:
+            sprite = pygame.Surface(rect.size).convert(screen)
+            sprite.fill(color)
+            self._dynamic_sprites.append((sprite, rect))
     
     def render(self, screen):
         """Render the current level."""
-        if self.current_level in self.levels:
-            # Draw background
-            screen.fill(self.levels[self.current_level]['background'])
-            
-            # Draw platforms
-            for platform in self.platforms:
-                pygame.draw.rect(screen, platform['color'], 
-                               (platform['x'], platform['y'], 
-                                platform['width'], platform['height']))
-            
-            # Draw goal
-            if self.goal:
-                pygame.draw.rect(screen, self.goal['color'],
-                               (self.goal['x'], self.goal['y'],
-                                self.goal['width'], self.goal['height']))
-            
-            # Draw enemies
-            for enemy in self.enemies:
-                pygame.draw.rect(screen, enemy['color'],
-                               (enemy['x'], enemy['y'],
-                                enemy['width'], enemy['height']))
+        if self._level_def is None:
+            return
+        
+        # Draw background, static platforms and goal in one blit
+        if self._static_bg is None:
+            self._bake_static_background(screen)
+        screen.blit(self._static_bg, (0, 0))
+        
+        # Draw moving platforms and enemies in a single call
+        screen.blits(self._dynamic_sprites, doreturn=False)
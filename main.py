@@ -3,10 +3,54 @@ import math
 import pygame
 import sys
 from enum import Enum, auto
+from functools import lru_cache
 
-from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS
+from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MAX_TICKS_PER_FRAME
 from player import PlayerBall
 from level_manager import LevelManager
+from file_utils import atomic_write_text
+
+@lru_cache(maxsize=32)
+def get_font(size):
+    """Return the default font at the given size, loading it only once."""
+    return pygame.font.Font(None, size)
+
+@lru_cache(maxsize=8)
+def get_sysfont(name, size, bold=False):
+    """Return a system font, matching and loading it only once."""
+    return pygame.font.SysFont(name, size, bold=bold)
+
+@lru_cache(maxsize=256)
+def render_text(text, size, color):
+    """Render antialiased text once per (text, size, color) and reuse it.
+    
+    The returned surface is shared, so callers must only blit it.
+    """
+    return get_font(size).render(text, True, color)
+
+@lru_cache(maxsize=64)
+def render_sysfont_text(text, name, size, color, bold=False):
+    """Like render_text, but with a system font."""
+    return get_sysfont(name, size, bold).render(text, True, color)
+
+def number_blits(glyphs, text, x, y):
+    """Yield the (glyph, pos) pairs that draw text from a pre-rendered glyph atlas."""
+    for ch in text:
+        glyph = glyphs[ch]
+        yield glyph, (x, y)
+        x += glyph.get_width()
+
+@lru_cache(maxsize=8)
+def picker_rects(x, y, size, count):
+    """Return the swatch rects of a 3-column color picker, built only once."""
+    color_size = size // 3
+    return tuple(
+        pygame.Rect(x + (i % 3) * (color_size + 5), y + (i // 3) * (color_size + 5), color_size, color_size)
+        for i in range(count)
+    )
+
+# Number keys that jump straight to a level on the level-select screen
+LEVEL_KEYS = {pygame.K_1: 1, pygame.K_2: 2, pygame.K_3: 3}
 
 # Game states
 class GameState(Enum):
@@ -17,6 +61,9 @@ class GameState(Enum):
     GAME_OVER = auto()
 
 class Game:
+    # Preview bob offsets: 5px sine over one 2000ms period, sampled every 10ms
+    _PULSE_LUT = [math.sin(i / 100 * math.pi) * 5 for i in range(200)]
+    
     def __init__(self):
         # Initialize pygame
         pygame.init()
@@ -25,12 +72,76 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Bounce Tales Clone")
         
+        # Menu background gradient, drawn once; the menu screens bake their titles onto copies.
+        # Subtle gradient from dark blue to darker blue: build a 1px column
+        # (the colour only steps every 30 rows) and let SDL stretch it
+        gradient_column = pygame.Surface((1, SCREEN_HEIGHT)).convert()
+        for band_y in range(0, SCREEN_HEIGHT, 30):
+            gradient_column.fill((15, 22, 40 + band_y // 30), (0, band_y, 1, 30))
+        self._gradient_bg = pygame.transform.scale(gradient_column, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Each menu screen's background with its shadowed title baked in
+        self._menu_bg = self._bake_title_background('Bounce Tales', 80, (20, 20, 40), 80)
+        self._customize_bg = self._bake_title_background("CUSTOMIZE BALL", 64, (20, 20, 30), 30)
+        self._level_select_bg = self._bake_title_background('SELECT LEVEL', 72, (20, 20, 40), 80)
+        
+        # Glyph atlases for the HUD counters (see number_blits)
+        self._score_glyphs = {ch: render_text(ch, 36, (255, 215, 0)) for ch in '-0123456789'}
+        self._lives_glyphs = {ch: render_sysfont_text(ch, 'Arial', 28, (255, 100, 100), bold=True)
+                              for ch in '×-0123456789'}
+        
+        # HUD level icon and the level it was drawn for
+        self._level_icon = None
+        self._level_icon_level = None
+        
+        # Semi-transparent HUD overlay, fading out from top to bottom
+        self._hud_bg = pygame.Surface((SCREEN_WIDTH, 80), pygame.SRCALPHA).convert_alpha()
+        for y in range(self._hud_bg.get_height()):
+            self._hud_bg.fill((30, 35, 45, 180 - y // 2), (0, y, SCREEN_WIDTH, 1))
+        
+        # Control hints down the right of the HUD, 30px apart
+        controls_text = [
+            '← → : Move',
+            '↑ / SPACE: Jump',
+            'R: Reset Level',
+            'ESC: Menu'
+        ]
+        self._hint_rects = [pygame.Rect(SCREEN_WIDTH - 200, 15 + i * 30, 180, 25)
+                            for i in range(len(controls_text))]
+        
+        # Rounded background shared by every hint (opaque, as it was when
+        # drawn straight to the screen)
+        self._hint_bg = pygame.Surface((180, 25), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.rect(self._hint_bg, (40, 45, 60), self._hint_bg.get_rect(), border_radius=12)
+        pygame.draw.rect(self._hint_bg, (80, 90, 120), self._hint_bg.get_rect(), 1, border_radius=12)
+        
+        self._hint_blits = [
+            self._bake_control_hint(control, hint_rect)
+            for control, hint_rect in zip(controls_text, self._hint_rects)
+        ]
+        
+        # Drop event types no handler reads before they reach the queue.
+        # Hover effects poll pygame.mouse.get_pos(), so motion events are unused.
+        pygame.event.set_blocked([
+            pygame.MOUSEMOTION,
+            pygame.ACTIVEEVENT,
+            pygame.AUDIODEVICEADDED,
+            pygame.AUDIODEVICEREMOVED,
+            pygame.FINGERMOTION,
+            pygame.JOYAXISMOTION,
+        ])
+        
         # Game clock
         self.clock = pygame.time.Clock()
         
         # Game state
         self.state = GameState.MENU
         self.running = True
+        # Set on every state change so screens rebuild cached layout
+        self._dirty_ui = True
+        
+        # High score shown on the menu, refreshed whenever the menu is entered
+        self._high_score = self.load_high_score()
         
         # Game objects
         self.player = None
@@ -42,38 +153,123 @@ class Game:
         
         # UI state
         self.hovered_level = None
-        self.level_buttons = {}
+        # Level-select button rects: 300x60, 20px apart, starting 40px
+        # below the top of the level container (y=150)
+        self.level_buttons = {
+            i: pygame.Rect(SCREEN_WIDTH // 2 - 150, 190 + (i - 1) * 80, 300, 60)
+            for i in range(1, 4)
+        }
+        # (surface, position) of each level button, normal and hovered
+        self._level_button_surfs = {
+            i: (self._bake_level_button(i, button_rect),
+                self._bake_level_button(i, button_rect.inflate(10, 4), hovered=True))
+            for i, button_rect in self.level_buttons.items()
+        }
         self.back_button_rect = None
+        # Level-select back button, normal and hovered
+        self._back_button_surfs = (self._bake_back_button(False), self._bake_back_button(True))
+        
+        # Mouse state, sampled once per frame in render()
+        self._mouse_pos = (0, 0)
+        self._mouse_buttons = (False, False, False)
+        
+        # Event handler for each game state
+        self.event_handlers = {
+            GameState.MENU: self.handle_menu_events,
+            GameState.CUSTOMIZE: self.handle_customize_events,
+            GameState.LEVEL_SELECT: self.handle_level_select_events,
+            GameState.GAME_PLAY: self.handle_game_play_events,
+            GameState.GAME_OVER: self.handle_game_over_events,
+        }
+        
+        # Customize-screen sections: 3 columns inside the controls panel
+        section_width = (SCREEN_WIDTH - 140) // 3
+        self.customize_sections = [
+            (section, pygame.Rect(70 + i * (section_width + 10), 340, section_width, SCREEN_HEIGHT - 400), render_section)
+            for i, (section, render_section) in enumerate([
+                ("COLORS", self._render_colors_section),
+                ("APPEARANCE", self._render_appearance_section),
+                ("PHYSICS", self._render_physics_section),
+            ])
+        ]
+        
+        # Customize-screen panel, drawn once (see _bake_customize_panel)
+        self._customize_panel_pos = (SCREEN_WIDTH // 2 - 400, 100)
+        self._customize_panel = self._bake_customize_panel()
+        
+        # Customize-screen key bindings
+        self.customize_key_handlers = {
+            pygame.K_ESCAPE: lambda: self._set_state(GameState.MENU),
+            # Toggle texture with T key, glow with G key
+            pygame.K_t: lambda: self.player.next_texture(),
+            pygame.K_g: self.toggle_glow,
+            # Size adjustment with + and - keys (fine control)
+            pygame.K_PLUS: lambda: self.player.set_size(self.player.size + 1),
+            pygame.K_EQUALS: lambda: self.player.set_size(self.player.size + 1),
+            pygame.K_MINUS: lambda: self.player.set_size(self.player.size - 1),
+            # Bounce adjustment with [ and ] keys
+            pygame.K_LEFTBRACKET: lambda: self.player.set_bounce(max(0.1, self.player.bounce_factor - 0.1)),
+            pygame.K_RIGHTBRACKET: lambda: self.player.set_bounce(min(1.0, self.player.bounce_factor + 0.1)),
+            # Opacity adjustment with , and . keys
+            pygame.K_COMMA: lambda: self.player.set_opacity(self.player.opacity - 25),
+            pygame.K_PERIOD: lambda: self.player.set_opacity(self.player.opacity + 25),
+            # Glow size adjustment with ; and ' keys
+            pygame.K_SEMICOLON: lambda: self.player.set_glow_size(self.player.glow_size - 0.1),
+            pygame.K_QUOTE: lambda: self.player.set_glow_size(self.player.glow_size + 0.1),
+        }
         
         # Initialize player when starting a game
         self.init_game()
     
+    def load_high_score(self):
+        """Read the saved high score, or None if there isn't a valid one."""
+        try:
+            with open('highscore.txt', 'r') as f:
+                return int(f.read())
+        except (FileNotFoundError, ValueError):
+            return None
+    
+    def record_high_score(self):
+        """Save the current score if it beats the saved high score.
+        
+        Called once on entering the game-over screen. The new record goes to
+        a temporary file that then replaces the old one.
+        """
+        high_score = self.load_high_score() or 0
+        if self.score > high_score:
+            high_score = self.score
+            atomic_write_text('highscore.txt', str(high_score))
+        self._high_score = high_score
+    
+    def _set_state(self, state):
+        """Switch game state, save pending ball changes and invalidate cached UI layout."""
+        self.state = state
+        self._dirty_ui = True
+        if self.player:
+            self.player.flush_customization()
+        if state == GameState.MENU:
+            self._high_score = self.load_high_score()
+        elif state == GameState.GAME_OVER:
+            self.record_high_score()
+    
     def handle_events(self):
+        # Drain the whole queue in one call
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             
             # Handle input based on current state
-            if self.state == GameState.MENU:
-                self.handle_menu_events(event)
-            elif self.state == GameState.CUSTOMIZE:
-                self.handle_customize_events(event)
-            elif self.state == GameState.LEVEL_SELECT:
-                self.handle_level_select_events(event)
-            elif self.state == GameState.GAME_PLAY:
-                self.handle_game_play_events(event)
-            elif self.state == GameState.GAME_OVER:
-                self.handle_game_over_events(event)
+            self.event_handlers[self.state](event)
     
     def handle_menu_events(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_1:
                 self.init_game()
-                self.state = GameState.GAME_PLAY
+                self._set_state(GameState.GAME_PLAY)
             elif event.key == pygame.K_2:
-                self.state = GameState.LEVEL_SELECT
+                self._set_state(GameState.LEVEL_SELECT)
             elif event.key == pygame.K_3:
-                self.state = GameState.CUSTOMIZE
+                self._set_state(GameState.CUSTOMIZE)
             elif event.key == pygame.K_4:
                 self.running = False
     
@@ -94,8 +290,7 @@ class Game:
     
     def draw_button(self, surface, rect, text, color, hover_color, text_color=(255, 255, 255), font_size=24):
         """Draw a button with hover effect."""
-        mouse_pos = pygame.mouse.get_pos()
-        is_hovered = rect.collidepoint(mouse_pos)
+        is_hovered = rect.collidepoint(self._mouse_pos)
         
         # Draw button background
         button_color = hover_color if is_hovered else color
@@ -103,24 +298,17 @@ class Game:
         pygame.draw.rect(surface, (100, 100, 100), rect, 2, border_radius=5)
         
         # Draw button text
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(text, True, text_color)
+        text_surface = render_text(text, font_size, text_color)
         text_rect = text_surface.get_rect(center=rect.center)
         surface.blit(text_surface, text_rect)
         
-        return is_hovered and pygame.mouse.get_pressed()[0] == 1
+        return is_hovered and self._mouse_buttons[0]
     
     def draw_color_picker(self, surface, x, y, size, colors, selected_color):
         """Draw a color picker with multiple color options."""
-        color_size = size // 3
-        color_rects = []
-        
-        for i, color in enumerate(colors):
-            row = i // 3
-            col = i % 3
-            rect = pygame.Rect(x + col * (color_size + 5), y + row * (color_size + 5), color_size, color_size)
-            color_rects.append((rect, color))
-            
+        color_rects = list(zip(picker_rects(x, y, size, len(colors)), colors))
+        
+        for rect, color in color_rects:
             # Draw color square
             pygame.draw.rect(surface, color, rect)
             
@@ -134,7 +322,7 @@ class Game:
     
     def handle_customize_events(self, event):
         if event.type == pygame.MOUSEBUTTONDOWN:
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             
             # Check if any slider was clicked
             if hasattr(self, 'slider_rects'):
@@ -157,79 +345,49 @@ class Game:
                         self.player.set_pattern_color(color)
         
         elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
-                self.state = GameState.MENU
-            
-            # Toggle texture with T key
-            elif event.key == pygame.K_t:
-                self.player.next_texture()
-            
-            # Toggle glow with G key
-            elif event.key == pygame.K_g:
-                self.player.toggle_glow()
-            
-            # Size adjustment with + and - keys (fine control)
-            elif event.key == pygame.K_PLUS or event.key == pygame.K_EQUALS:
-                self.player.set_size(self.player.customization['size'] + 1)
-            elif event.key == pygame.K_MINUS:
-                self.player.set_size(self.player.customization['size'] - 1)
-            
-            # Bounce adjustment with [ and ] keys
-            elif event.key == pygame.K_LEFTBRACKET:
-                self.player.set_bounce(max(0.1, self.player.customization['bounce_factor'] - 0.1))
-            elif event.key == pygame.K_RIGHTBRACKET:
-                self.player.set_bounce(min(1.0, self.player.customization['bounce_factor'] + 0.1))
-            
-            # Opacity adjustment with , and . keys
-            elif event.key == pygame.K_COMMA:
-                self.player.set_opacity(self.player.customization['opacity'] - 25)
-            elif event.key == pygame.K_PERIOD:
-                self.player.set_opacity(self.player.customization['opacity'] + 25)
-            
-            # Glow size adjustment with ; and ' keys
-            elif event.key == pygame.K_SEMICOLON:
-                self.player.set_glow_size(self.player.customization['glow_size'] - 0.1)
-            elif event.key == pygame.K_QUOTE:
-                self.player.set_glow_size(self.player.customization['glow_size'] + 0.1)
-            elif event.key == pygame.K_t:
-                current = self.player.customization['texture']
-                self.player.set_texture('striped' if current == 'solid' else 'solid')
+            handler = self.customize_key_handlers.get(event.key)
+            if handler:
+                handler()
+    
+    def toggle_glow(self):
+        """Toggle the ball's glow; the glow slider appears/disappears with it."""
+        self.player.toggle_glow()
+        self._dirty_ui = True
     
     def handle_level_select_events(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
-                self.state = GameState.MENU
-            elif event.key in [pygame.K_1, pygame.K_2, pygame.K_3]:
-                level_num = int(pygame.key.name(event.key))
-                if 1 <= level_num <= 3:
-                    self.current_level = level_num
-                    self.init_game(False)
-                    self.state = GameState.GAME_PLAY
+                self._set_state(GameState.MENU)
+            elif event.key in LEVEL_KEYS:
+                self.current_level = LEVEL_KEYS[event.key]
+                self.init_game(False)
+                self._set_state(GameState.GAME_PLAY)
         
         # Handle mouse clicks for level selection
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:  # Left click
-            mouse_pos = pygame.mouse.get_pos()
+            mouse_pos = event.pos
             
             # Check if a level button was clicked
             for level, button_rect in self.level_buttons.items():
                 if button_rect.collidepoint(mouse_pos):
                     self.current_level = level
                     self.init_game(False)
-                    self.state = GameState.GAME_PLAY
+                    self._set_state(GameState.GAME_PLAY)
                     return
             
             # Check if back button was clicked
             if self.back_button_rect and self.back_button_rect.collidepoint(mouse_pos):
-                self.state = GameState.MENU
+                self._set_state(GameState.MENU)
     
     def handle_game_play_events(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
-                self.state = GameState.MENU
+                self._set_state(GameState.MENU)
             elif event.key == pygame.K_r:  # Reset level
                 self.init_game(False)
-                
-        # Handle continuous key presses
+    
+    def handle_game_play_keys(self):
+        """Handle continuous key presses."""
         keys = pygame.key.get_pressed()
         if keys[pygame.K_LEFT] or keys[pygame.K_a]:
             self.player.move_left()
@@ -241,7 +399,7 @@ class Game:
     def handle_game_over_events(self, event):
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_RETURN:
-                self.state = GameState.MENU
+                self._set_state(GameState.MENU)
     
     def init_game(self, reset_lives=True):
         """Initialize or reset the game."""
@@ -253,6 +411,9 @@ class Game:
         # Initialize player at level start position
         start_pos = self.level_manager.load_level(self.current_level)
         if start_pos:
+            # The new ball loads its look from disk, so save any pending changes first
+            if self.player:
+                self.player.flush_customization()
             self.player = PlayerBall(start_pos[0], start_pos[1])
     
     def next_level(self):
@@ -266,17 +427,18 @@ class Game:
     def update(self):
         # Update game objects based on current state
         if self.state == GameState.GAME_PLAY and self.player:
-            # Check for water platforms
-            water_platforms = self.level_manager.get_water_platforms()
-            in_water = False
-            for platform in water_platforms:
-                if (platform['x'] <= self.player.x <= platform['x'] + platform['width'] and
-                    platform['y'] <= self.player.y + self.player.customization['size'] <= platform['y'] + platform['height']):
-                    in_water = True
-                    break
+            # Held keys are polled once per tick, not once per event
+            self.handle_game_play_keys()
+            
+            # Check whether the bottom of the ball is in water
+            in_water = self.level_manager.is_in_water(
+                self.player.x, self.player.y + self.player.size)
+            
+            # Only hand the player the platforms near its path
+            nearby = self.level_manager.nearby_platform_bounds(self.player.sweep_rect())
             
             # Update player with water physics if needed
-            self.player.update(self.level_manager.platforms, in_water)
+            self.player.update(nearby, in_water)
             
             # Update level and check for win/lose conditions
             result = self.level_manager.update(self.player)
@@ -284,18 +446,23 @@ class Game:
             if result == 'level_complete':
                 self.score += 100 * self.current_level
                 if not self.next_level():
-                    self.state = GameState.GAME_OVER
+                    self._set_state(GameState.GAME_OVER)
                     
             elif result == 'player_dead' or self.player.y > SCREEN_HEIGHT + 100:
                 self.lives -= 1
                 if self.lives <= 0:
-                    self.state = GameState.GAME_OVER
+                    self._set_state(GameState.GAME_OVER)
                 else:
                     self.init_game(False)  # Reset current level
     
     def render(self):
-        # Clear the screen
-        self.screen.fill((0, 0, 0))  # Black background
+        # Sample the mouse once for every widget drawn this frame
+        self._mouse_pos = pygame.mouse.get_pos()
+        self._mouse_buttons = pygame.mouse.get_pressed()
+        
+        # Clear the screen (the menu screens repaint it with the gradient)
+        if self.state not in (GameState.MENU, GameState.CUSTOMIZE, GameState.LEVEL_SELECT):
+            self.screen.fill((0, 0, 0))  # Black background
         
         # Render based on current state
         if self.state == GameState.MENU:
@@ -313,23 +480,8 @@ class Game:
         pygame.display.flip()
     
     def render_menu(self):
-        # Modern gradient background
-        for y in range(SCREEN_HEIGHT):
-            # Subtle gradient from dark blue to darker blue
-            color = (15, 22, 40 + y // 30)
-            pygame.draw.line(self.screen, color, (0, y), (SCREEN_WIDTH, y))
-        
-        # Title with subtle shadow
-        title_font = pygame.font.Font(None, 80)
-        title_text = 'Bounce Tales'
-        
-        # Title shadow
-        title_shadow = title_font.render(title_text, True, (20, 20, 40))
-        self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title_shadow.get_width()//2 + 3, 83))
-        
-        # Main title
-        title_surface = title_font.render(title_text, True, (255, 255, 255))
-        self.screen.blit(title_surface, (SCREEN_WIDTH//2 - title_surface.get_width()//2, 80))
+        # Modern gradient background with the shadowed title
+        self.screen.blit(self._menu_bg, (0, 0))
         
         # Menu items
         menu_items = [
@@ -340,8 +492,7 @@ class Game:
         ]
         
         # Draw menu items with hover effect
-        mouse_pos = pygame.mouse.get_pos()
-        font = pygame.font.Font(None, 42)
+        mouse_pos = self._mouse_pos
         
         for i, (text, color) in enumerate(menu_items):
             # Button background
@@ -365,17 +516,14 @@ class Game:
             pygame.draw.rect(self.screen, button_color, button_rect, border_radius=10, width=3)
             
             # Draw button text
-            text_surface = font.render(text, True, (240, 240, 240))
+            text_surface = render_text(text, 42, (240, 240, 240))
             text_rect = text_surface.get_rect(center=button_rect.center)
             self.screen.blit(text_surface, text_rect)
         
-        # High score
-        try:
-            with open('highscore.txt', 'r') as f:
-                high_score = int(f.read())
-            score_font = pygame.font.Font(None, 36)
-            score_text = f'High Score: {high_score}'
-            score_surface = score_font.render(score_text, True, (255, 215, 0))
+        # High score (read from disk only when entering the menu)
+        if self._high_score is not None:
+            score_text = f'High Score: {self._high_score}'
+            score_surface = render_text(score_text, 36, (255, 215, 0))
             
             # Score background
             score_bg = pygame.Rect(
@@ -391,208 +539,206 @@ class Game:
                 score_surface,
                 (SCREEN_WIDTH//2 - score_surface.get_width()//2, 530)
             )
-        except (FileNotFoundError, ValueError):
-            pass
             
         # Version info
-        version_font = pygame.font.Font(None, 20)
         version_text = 'v1.0.0'
-        version_surface = version_font.render(version_text, True, (100, 100, 120))
+        version_surface = render_text(version_text, 20, (100, 100, 120))
         self.screen.blit(version_surface, (SCREEN_WIDTH - version_surface.get_width() - 10, 
                                          SCREEN_HEIGHT - version_surface.get_height() - 10))
     
-    def render_customize(self):
-        """Render the customization screen with modern UI elements."""
-        # Modern gradient background
-        for y in range(SCREEN_HEIGHT):
-            # Subtle gradient from dark blue to darker blue
-            color = (15, 22, 40 + y // 30)
-            pygame.draw.line(self.screen, color, (0, y), (SCREEN_WIDTH, y))
-            
-        # Draw a semi-transparent panel for content
-        panel = pygame.Surface((800, 500), pygame.SRCALPHA)
+    def _bake_customize_panel(self):
+        """Draw the static frame of the customize screen onto one surface."""
+        # Semi-transparent panel for content
+        panel = pygame.Surface((800, 500), pygame.SRCALPHA).convert_alpha()
         panel.fill((30, 40, 60, 200))  # Semi-transparent dark blue
         pygame.draw.rect(panel, (255, 255, 255, 20), panel.get_rect(), 2, border_radius=15)
-        self.screen.blit(panel, (SCREEN_WIDTH//2 - 400, 100))
         
-        # Draw title with shadow
-        font_large = pygame.font.Font(None, 64)
-        title = font_large.render("CUSTOMIZE BALL", True, (20, 20, 30))
-        self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2 + 3, 33))
-        title = font_large.render("CUSTOMIZE BALL", True, (255, 255, 255))
-        self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 30))
+        # Everything below is laid out in screen coordinates
+        offset_x, offset_y = self._customize_panel_pos
         
-        # Draw preview area
-        preview_rect = pygame.Rect(SCREEN_WIDTH // 2 - 150, 100, 300, 200)
-        pygame.draw.rect(self.screen, (30, 40, 60), preview_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (60, 80, 120), preview_rect, 2, border_radius=10)
+        def to_panel(rect):
+            return rect.move(-offset_x, -offset_y)
+        
+        # Preview area
+        preview_rect = to_panel(pygame.Rect(SCREEN_WIDTH // 2 - 150, 100, 300, 200))
+        pygame.draw.rect(panel, (30, 40, 60), preview_rect, border_radius=10)
+        pygame.draw.rect(panel, (60, 80, 120), preview_rect, 2, border_radius=10)
+        
+        # Controls panel (opaque, as it was when drawn straight to the screen)
+        panel_rect = to_panel(pygame.Rect(50, 320, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 370))
+        pygame.draw.rect(panel, (40, 50, 70), panel_rect, border_radius=10)
+        pygame.draw.rect(panel, (80, 120, 180), panel_rect, 2, border_radius=10)
+        
+        # Section backgrounds and headers
+        for section, section_rect, render_section in self.customize_sections:
+            section_rect = to_panel(section_rect)
+            pygame.draw.rect(panel, (30, 40, 60), section_rect, border_radius=8)
+            pygame.draw.rect(panel, (60, 100, 160), section_rect, 1, border_radius=8)
+            
+            text = render_text(section, 28, (200, 220, 255))
+            panel.blit(text, (section_rect.centerx - text.get_width() // 2, 350 - offset_y))
+        
+        return panel
+    
+    def _render_colors_section(self, section_rect):
+        """Draw the ball and pattern color pickers"""
+        # Primary colors
+        colors = [
+            (255, 50, 50),   # Red
+            (50, 200, 50),   # Green
+            (50, 150, 255),  # Blue
+            (255, 200, 50),  # Yellow
+            (200, 50, 200),  # Purple
+            (50, 200, 200),  # Cyan
+            (255, 150, 50),  # Orange
+            (200, 50, 100),  # Pink
+            (100, 50, 200)   # Violet
+        ]
+        self.color_rects = self.draw_color_picker(self.screen, section_rect.x + 20, 380, 40, colors, 
+                                               self.player.color)
+        
+        # Secondary colors (for patterns)
+        secondary_colors = [
+            (255, 255, 255),  # White
+            (240, 240, 240),  # Light Gray
+            (200, 200, 200),  # Silver
+            (150, 150, 150),  # Gray
+            (100, 100, 100),  # Dark Gray
+            (255, 255, 200),  # Light Yellow
+            (200, 255, 200),  # Light Green
+            (200, 200, 255),  # Light Blue
+            (255, 200, 200)   # Light Red
+        ]
+        text = render_text("Pattern:", 28, (200, 220, 255))
+        self.screen.blit(text, (section_rect.x + 20, 500))
+        self.secondary_color_rects = self.draw_color_picker(self.screen, section_rect.x + 20, 530, 30, 
+                                                          secondary_colors, self.player.pattern_color)
+    
+    def _render_appearance_section(self, section_rect):
+        """Draw the size, opacity and glow controls"""
+        # Size slider
+        text = render_text(f"Size: {self.player.size}", 22, (220, 220, 220))
+        self.screen.blit(text, (section_rect.x + 20, 380))
+        size_slider = self.draw_slider(self.screen, section_rect.x + 20, 410, section_rect.width - 40, 30, 
+                                     self.player.size, 10, 50, (100, 150, 255))
+        
+        # Opacity slider
+        opacity_pct = int((self.player.opacity / 255) * 100)
+        text = render_text(f"Opacity: {opacity_pct}%", 22, (220, 220, 220))
+        self.screen.blit(text, (section_rect.x + 20, 460))
+        opacity_slider = self.draw_slider(self.screen, section_rect.x + 20, 490, section_rect.width - 40, 30, 
+                                        self.player.opacity, 50, 255, (100, 200, 150))
+        
+        # Glow toggle
+        glow_text = "Glow: ON" if self.player.glow else "Glow: OFF"
+        glow_color = (100, 255, 100) if self.player.glow else (200, 100, 100)
+        glow_rect = pygame.Rect(section_rect.x + 20, 560, section_rect.width - 40, 40)
+        if self.draw_button(self.screen, glow_rect, glow_text, (40, 50, 70), glow_color):
+            self.toggle_glow()
+        
+        # Glow size slider (only show if glow is on)
+        if self.player.glow:
+            text = render_text(f"Glow Size: {self.player.glow_size:.1f}", 22, (220, 220, 220))
+            self.screen.blit(text, (section_rect.x + 20, 610))
+            glow_slider = self.draw_slider(self.screen, section_rect.x + 20, 640, section_rect.width - 40, 30, 
+                                         self.player.glow_size, 1.0, 2.5, (200, 150, 255))
+        
+        # Store slider rects for click handling (only when the layout changed)
+        if self._dirty_ui:
+            self.slider_rects = [
+                (pygame.Rect(section_rect.x + 20, 410, section_rect.width - 40, 30), 
+                 (10, 50, self.player.set_size)),
+                (pygame.Rect(section_rect.x + 20, 490, section_rect.width - 40, 30), 
+                 (50, 255, lambda x: self.player.set_opacity(int(x)))),
+            ]
+        
+            if self.player.glow:
+                self.slider_rects.append(
+                    (pygame.Rect(section_rect.x + 20, 640, section_rect.width - 40, 30), 
+                     (1.0, 2.5, self.player.set_glow_size))
+                )
+    
+    def _render_physics_section(self, section_rect):
+        """Draw the bounce slider and texture button"""
+        # Bounce factor slider
+        bounce_pct = int(self.player.bounce_factor * 100)
+        text = render_text(f"Bounce: {bounce_pct}%", 22, (220, 220, 220))
+        self.screen.blit(text, (section_rect.x + 20, 380))
+        bounce_slider = self.draw_slider(self.screen, section_rect.x + 20, 410, section_rect.width - 40, 30, 
+                                       self.player.bounce_factor, 0.1, 1.0, (255, 180, 100))
+        
+        # Texture selection
+        text = render_text("Texture:", 22, (220, 220, 220))
+        self.screen.blit(text, (section_rect.x + 20, 460))
+        
+        texture_names = {
+            'solid': 'Solid',
+            'striped': 'Striped',
+            'gradient': 'Gradient',
+            'polka': 'Polka Dots'
+        }
+        texture_rect = pygame.Rect(section_rect.x + 20, 490, section_rect.width - 40, 40)
+        if self.draw_button(self.screen, texture_rect, 
+                          texture_names[self.player.texture], 
+                          (60, 70, 100), (100, 150, 255)):
+            self.player.next_texture()
+        
+        # Add physics slider to slider rects
+        if self._dirty_ui:
+            self.slider_rects.append(
+                (pygame.Rect(section_rect.x + 20, 410, section_rect.width - 40, 30), 
+                 (0.1, 1.0, self.player.set_bounce))
+            )
+    
+    def render_customize(self):
+        """Render the customization screen with modern UI elements."""
+        # Modern gradient background with the shadowed title
+        self.screen.blit(self._customize_bg, (0, 0))
+            
+        # Draw the pre-composited content panel (preview area, controls
+        # panel and section frames)
+        self.screen.blit(self._customize_panel, self._customize_panel_pos)
         
         # Draw preview ball with a subtle animation
         preview_x = SCREEN_WIDTH // 2
         preview_y = 200
         
-        # Add a subtle pulse effect to the preview
-        pulse = (pygame.time.get_ticks() % 2000) / 1000.0
-        pulse_offset = math.sin(pulse * math.pi) * 5
+        # Add a subtle pulse effect to the preview (2s period, 10ms steps)
+        pulse_offset = self._PULSE_LUT[(pygame.time.get_ticks() % 2000) // 10]
         
         if self.player:
             # Save current state
             original_x, original_y = self.player.x, self.player.y
-            original_size = self.player.customization['size']
+            original_size = self.player.size
             
             # Set preview state
             self.player.x, self.player.y = preview_x, preview_y + pulse_offset
-            self.player.customization['size'] = 40  # Fixed size for preview
+            self.player.size = 40  # Fixed size for preview
             
             # Render the ball with preview settings
             self.player.render(self.screen, is_preview=True)
             
             # Restore original state
             self.player.x, self.player.y = original_x, original_y
-            self.player.customization['size'] = original_size
+            self.player.size = original_size
         
-        # Draw controls panel
-        panel_rect = pygame.Rect(50, 320, SCREEN_WIDTH - 100, SCREEN_HEIGHT - 370)
-        pygame.draw.rect(self.screen, (40, 50, 70, 200), panel_rect, border_radius=10)
-        pygame.draw.rect(self.screen, (80, 120, 180), panel_rect, 2, border_radius=10)
+        # Draw section content
+        for section, section_rect, render_section in self.customize_sections:
+            render_section(section_rect)
         
-        # Draw section headers
-        font_medium = pygame.font.Font(None, 28)
-        sections = ["COLORS", "APPEARANCE", "PHYSICS"]
-        section_x = 70
-        section_width = (SCREEN_WIDTH - 140) // 3
-        
-        # Draw section backgrounds and headers
-        for i, section in enumerate(sections):
-            section_rect = pygame.Rect(section_x + i * (section_width + 10), 340, section_width, SCREEN_HEIGHT - 400)
-            pygame.draw.rect(self.screen, (30, 40, 60), section_rect, border_radius=8)
-            pygame.draw.rect(self.screen, (60, 100, 160), section_rect, 1, border_radius=8)
-            
-            text = font_medium.render(section, True, (200, 220, 255))
-            self.screen.blit(text, (section_rect.centerx - text.get_width() // 2, 350))
-            
-            # Draw section content
-            if i == 0:  # COLORS
-                # Primary colors
-                colors = [
-                    (255, 50, 50),   # Red
-                    (50, 200, 50),   # Green
-                    (50, 150, 255),  # Blue
-                    (255, 200, 50),  # Yellow
-                    (200, 50, 200),  # Purple
-                    (50, 200, 200),  # Cyan
-                    (255, 150, 50),  # Orange
-                    (200, 50, 100),  # Pink
-                    (100, 50, 200)   # Violet
-                ]
-                self.color_rects = self.draw_color_picker(self.screen, section_rect.x + 20, 380, 40, colors, 
-                                                       self.player.customization['color'])
-                
-                # Secondary colors (for patterns)
-                secondary_colors = [
-                    (255, 255, 255),  # White
-                    (240, 240, 240),  # Light Gray
-                    (200, 200, 200),  # Silver
-                    (150, 150, 150),  # Gray
-                    (100, 100, 100),  # Dark Gray
-                    (255, 255, 200),  # Light Yellow
-                    (200, 255, 200),  # Light Green
-                    (200, 200, 255),  # Light Blue
-                    (255, 200, 200)   # Light Red
-                ]
-                text = font_medium.render("Pattern:", True, (200, 220, 255))
-                self.screen.blit(text, (section_rect.x + 20, 500))
-                self.secondary_color_rects = self.draw_color_picker(self.screen, section_rect.x + 20, 530, 30, 
-                                                                  secondary_colors, self.player.customization['pattern_color'])
-                
-            elif i == 1:  # APPEARANCE
-                # Size slider
-                font_small = pygame.font.Font(None, 22)
-                text = font_small.render(f"Size: {self.player.customization['size']}", True, (220, 220, 220))
-                self.screen.blit(text, (section_rect.x + 20, 380))
-                size_slider = self.draw_slider(self.screen, section_rect.x + 20, 410, section_width - 40, 30, 
-                                             self.player.customization['size'], 10, 50, (100, 150, 255))
-                
-                # Opacity slider
-                opacity_pct = int((self.player.customization['opacity'] / 255) * 100)
-                text = font_small.render(f"Opacity: {opacity_pct}%", True, (220, 220, 220))
-                self.screen.blit(text, (section_rect.x + 20, 460))
-                opacity_slider = self.draw_slider(self.screen, section_rect.x + 20, 490, section_width - 40, 30, 
-                                                self.player.customization['opacity'], 50, 255, (100, 200, 150))
-                
-                # Glow toggle
-                glow_text = "Glow: ON" if self.player.customization['glow'] else "Glow: OFF"
-                glow_color = (100, 255, 100) if self.player.customization['glow'] else (200, 100, 100)
-                glow_rect = pygame.Rect(section_rect.x + 20, 560, section_width - 40, 40)
-                if self.draw_button(self.screen, glow_rect, glow_text, (40, 50, 70), glow_color):
-                    self.player.toggle_glow()
-                
-                # Glow size slider (only show if glow is on)
-                if self.player.customization['glow']:
-                    text = font_small.render(f"Glow Size: {self.player.customization['glow_size']:.1f}", True, (220, 220, 220))
-                    self.screen.blit(text, (section_rect.x + 20, 610))
-                    glow_slider = self.draw_slider(self.screen, section_rect.x + 20, 640, section_width - 40, 30, 
-                                                 self.player.customization['glow_size'], 1.0, 2.5, (200, 150, 255))
-                
-                # Store slider rects for click handling
-                self.slider_rects = [
-                    (pygame.Rect(section_rect.x + 20, 410, section_width - 40, 30), 
-                     (10, 50, self.player.set_size)),
-                    (pygame.Rect(section_rect.x + 20, 490, section_width - 40, 30), 
-                     (50, 255, lambda x: self.player.set_opacity(int(x)))),
-                ]
-                
-                if self.player.customization['glow']:
-                    self.slider_rects.append(
-                        (pygame.Rect(section_rect.x + 20, 640, section_width - 40, 30), 
-                         (1.0, 2.5, self.player.set_glow_size))
-                    )
-                
-            elif i == 2:  # PHYSICS
-                # Bounce factor slider
-                font_small = pygame.font.Font(None, 22)
-                bounce_pct = int(self.player.customization['bounce_factor'] * 100)
-                text = font_small.render(f"Bounce: {bounce_pct}%", True, (220, 220, 220))
-                self.screen.blit(text, (section_rect.x + 20, 380))
-                bounce_slider = self.draw_slider(self.screen, section_rect.x + 20, 410, section_width - 40, 30, 
-                                               self.player.customization['bounce_factor'], 0.1, 1.0, (255, 180, 100))
-                
-                # Texture selection
-                text = font_small.render("Texture:", True, (220, 220, 220))
-                self.screen.blit(text, (section_rect.x + 20, 460))
-                
-                texture_names = {
-                    'solid': 'Solid',
-                    'striped': 'Striped',
-                    'gradient': 'Gradient',
-                    'polka': 'Polka Dots'
-                }
-                texture_rect = pygame.Rect(section_rect.x + 20, 490, section_width - 40, 40)
-                if self.draw_button(self.screen, texture_rect, 
-                                  texture_names[self.player.customization['texture']], 
-                                  (60, 70, 100), (100, 150, 255)):
-                    self.player.next_texture()
-                
-                # Add physics slider to slider rects
-                if not hasattr(self, 'slider_rects'):
-                    self.slider_rects = []
-                self.slider_rects.append(
-                    (pygame.Rect(section_rect.x + 20, 410, section_width - 40, 30), 
-                     (0.1, 1.0, self.player.set_bounce))
-                )
+        self._dirty_ui = False
         
         # Draw back and play buttons
         back_rect = pygame.Rect(50, SCREEN_HEIGHT - 40, 150, 40)
         play_rect = pygame.Rect(SCREEN_WIDTH - 200, SCREEN_HEIGHT - 40, 150, 40)
         
         if self.draw_button(self.screen, back_rect, "BACK", (200, 50, 50), (230, 70, 70)):
-            self.state = GameState.MENU
+            self._set_state(GameState.MENU)
             
         if self.draw_button(self.screen, play_rect, "PLAY NOW!", (50, 200, 50), (70, 230, 70)):
-            self.state = GameState.LEVEL_SELECT
+            self._set_state(GameState.LEVEL_SELECT)
         
         # Draw instructions
-        font_small = pygame.font.Font(None, 22)
         instructions = [
             "Click and drag sliders to adjust values",
             "Click color swatches to change colors",
@@ -601,22 +747,112 @@ class Game:
         ]
         
         for i, text in enumerate(instructions):
-            text_surface = font_small.render(text, True, (180, 190, 210))
+            text_surface = render_text(text, 22, (180, 190, 210))
             self.screen.blit(text_surface, (SCREEN_WIDTH // 2 - text_surface.get_width() // 2, SCREEN_HEIGHT - 80 - i * 25))
     
+    def _bake_title_background(self, text, size, shadow_color, y):
+        """Return a copy of the gradient with a centred white title and its
+        3px shadow drawn on it.
+        
+        The title sits on the opaque gradient, so the result blits exactly
+        like drawing the shadow and title separately.
+        """
+        background = self._gradient_bg.copy()
+        shadow = render_text(text, size, shadow_color)
+        title = render_text(text, size, (255, 255, 255))
+        x = SCREEN_WIDTH // 2 - title.get_width() // 2
+        background.blit(shadow, (x + 3, y + 3))
+        background.blit(title, (x, y))
+        return background
+    
+    def _bake_back_button(self, hovered):
+        """Draw the level-select back button with its shadow and label onto one surface."""
+        # Room for the 120x50 button plus its shadow, 3px down and right
+        surface = pygame.Surface((123, 53), pygame.SRCALPHA).convert_alpha()
+        back_rect = pygame.Rect(0, 0, 120, 50)
+        
+        # Button shadow (opaque, as it was when drawn straight to the screen)
+        pygame.draw.rect(surface, (0, 0, 0), back_rect.move(3, 3), border_radius=25)
+        
+        # Button background
+        back_color = (231, 76, 60) if hovered else (192, 57, 43)
+        pygame.draw.rect(surface, back_color, back_rect, border_radius=25)
+        pygame.draw.rect(surface, (255, 255, 255), back_rect, 2, border_radius=25)
+        
+        # Back button text
+        back_text = render_text('← Back', 32, (255, 255, 255))
+        back_text_shadow = render_text('← Back', 32, (0, 0, 0, 100))
+        
+        # Text shadow
+        surface.blit(back_text_shadow, (back_rect.centerx - back_text.get_width()//2 + 2, 
+                                        back_rect.centery - back_text.get_height()//2 + 2))
+        
+        # Main text
+        surface.blit(back_text, (back_rect.centerx - back_text.get_width()//2, 
+                                 back_rect.centery - back_text.get_height()//2))
+        
+        return surface
+    
+    def _bake_level_button(self, level, button_rect, hovered=False):
+        """Draw a level-select button with its drop shadow onto one surface.
+        
+        Returns the surface and the screen position to blit it at.
+        """
+        # Level colors (vibrant but not too bright)
+        level_colors = [
+            (255, 100, 100),  # Red
+            (100, 200, 100),  # Green
+            (100, 150, 255)   # Blue
+        ]
+        
+        # Room for the button plus its shadow, 4px down and right
+        surface = pygame.Surface((button_rect.width + 4, button_rect.height + 4), pygame.SRCALPHA).convert_alpha()
+        local_rect = pygame.Rect(0, 0, button_rect.width, button_rect.height)
+        
+        # Button shadow (opaque, as it was when drawn straight to the screen)
+        pygame.draw.rect(surface, (0, 0, 0), local_rect.move(4, 4), border_radius=30)
+        
+        # Button background with gradient
+        color = level_colors[level - 1]
+        hover_boost = 30 if hovered else 0
+        base_color = (
+            min(255, color[0] + hover_boost),
+            min(255, color[1] + hover_boost),
+            min(255, color[2] + hover_boost)
+        )
+        
+        # Draw gradient background
+        for dy in range(local_rect.height):
+            # Darken towards bottom
+            r = max(0, base_color[0] - dy // 3)
+            g = max(0, base_color[1] - dy // 3)
+            b = max(0, base_color[2] - dy // 3)
+            pygame.draw.rect(surface, (r, g, b), (0, dy, local_rect.width, 1), border_radius=30)
+        
+        # Button border
+        border_color = (255, 255, 255) if hovered else (200, 200, 200)
+        pygame.draw.rect(surface, border_color, local_rect, 2, border_radius=30)
+        
+        # Level text with shadow
+        level_text = f'LEVEL {level}'
+        
+        # Text shadow
+        text_surface = render_text(level_text, 36, (0, 0, 0, 100))
+        surface.blit(text_surface, 
+                     (local_rect.centerx - text_surface.get_width()//2 + 2,
+                      local_rect.centery - text_surface.get_height()//2 + 2))
+        
+        # Main text
+        text_surface = render_text(level_text, 36, (255, 255, 255))
+        surface.blit(text_surface, 
+                     (local_rect.centerx - text_surface.get_width()//2,
+                      local_rect.centery - text_surface.get_height()//2))
+        
+        return surface, button_rect.topleft
+    
     def render_level_select(self):
-        # Modern gradient background
-        for y in range(SCREEN_HEIGHT):
-            color = (15, 22, 40 + y // 30)  # Same as main menu
-            pygame.draw.line(self.screen, color, (0, y), (SCREEN_WIDTH, y))
-        
-        # Title with shadow
-        title_font = pygame.font.Font(None, 72)
-        title_text = 'SELECT LEVEL'
-        title_shadow = title_font.render(title_text, True, (20, 20, 40))
-        title = title_font.render(title_text, True, (255, 255, 255))
-        self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title.get_width()//2 + 3, 83))
-        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 80))
+        # Modern gradient background with the shadowed title
+        self.screen.blit(self._level_select_bg, (0, 0))
         
         # Level buttons container
         container_width = 500
@@ -629,122 +865,48 @@ class Game:
         pygame.draw.rect(self.screen, (40, 45, 60), container_rect, border_radius=15)
         pygame.draw.rect(self.screen, (80, 90, 120), container_rect, 2, border_radius=15)
         
-        # Level colors (vibrant but not too bright)
-        level_colors = [
-            (255, 100, 100),  # Red
-            (100, 200, 100),  # Green
-            (100, 150, 255)   # Blue
-        ]
-        
         # Track hover state
-        mouse_pos = pygame.mouse.get_pos()
+        mouse_pos = self._mouse_pos
         self.hovered_level = None
         
-        # Draw level buttons
-        button_width = 300
-        button_height = 60
-        button_margin = 20
-        start_y = container_y + 40
-        
-        self.level_buttons = {}  # Reset level buttons
-        
-        for i in range(1, 4):
-            button_rect = pygame.Rect(
-                SCREEN_WIDTH // 2 - button_width // 2,
-                start_y + (i-1) * (button_height + button_margin),
-                button_width,
-                button_height
-            )
-            
-            # Store button rect for click detection
-            self.level_buttons[i] = button_rect
-            
-            # Check if mouse is hovering over this button
+        # Draw the pre-rendered level buttons (see _bake_level_button),
+        # skipping any outside the clip
+        clip = self.screen.get_clip()
+        for i, button_rect in self.level_buttons.items():
+            if not clip.colliderect(button_rect):
+                continue
             is_hovered = button_rect.collidepoint(mouse_pos)
             if is_hovered:
                 self.hovered_level = i
-                # Slight scale effect on hover
-                button_rect = button_rect.inflate(10, 4)
-            
-            # Button shadow
-            shadow_rect = button_rect.move(4, 4)
-            pygame.draw.rect(self.screen, (0, 0, 0, 80), shadow_rect, border_radius=30)
-            
-            # Button background with gradient
-            color = level_colors[i-1]
-            hover_boost = 30 if is_hovered else 0
-            base_color = (
-                min(255, color[0] + hover_boost),
-                min(255, color[1] + hover_boost),
-                min(255, color[2] + hover_boost)
-            )
-            
-            # Draw gradient background
-            for dy in range(button_rect.height):
-                # Darken towards bottom
-                r = max(0, base_color[0] - dy // 3)
-                g = max(0, base_color[1] - dy // 3)
-                b = max(0, base_color[2] - dy // 3)
-                pygame.draw.rect(self.screen, (r, g, b), 
-                               (button_rect.x, button_rect.y + dy, button_rect.width, 1),
-                               border_radius=30)
-            
-            # Button border
-            border_color = (255, 255, 255) if is_hovered else (200, 200, 200, 150)
-            pygame.draw.rect(self.screen, border_color, button_rect, 2, border_radius=30)
-            
-            # Level text with shadow
-            font = pygame.font.Font(None, 36)
-            level_text = f'LEVEL {i}'
-            
-            # Text shadow
-            text_surface = font.render(level_text, True, (0, 0, 0, 100))
-            self.screen.blit(text_surface, 
-                           (button_rect.centerx - text_surface.get_width()//2 + 2,
-                            button_rect.centery - text_surface.get_height()//2 + 2))
-            
-            # Main text
-            text_surface = font.render(level_text, True, (255, 255, 255))
-            self.screen.blit(text_surface, 
-                           (button_rect.centerx - text_surface.get_width()//2,
-                            button_rect.centery - text_surface.get_height()//2))
+            self.screen.blit(*self._level_button_surfs[i][is_hovered])
         
-        # Back button
+        # Back button (pre-rendered, see _bake_back_button)
         back_rect = pygame.Rect(40, 40, 120, 50)
         back_hover = back_rect.collidepoint(mouse_pos)
-        
-        # Button shadow
-        back_shadow = back_rect.move(3, 3)
-        pygame.draw.rect(self.screen, (0, 0, 0, 100), back_shadow, border_radius=25)
-        
-        # Button background
-        back_color = (231, 76, 60) if back_hover else (192, 57, 43)
-        pygame.draw.rect(self.screen, back_color, back_rect, border_radius=25)
-        pygame.draw.rect(self.screen, (255, 255, 255, 100), back_rect, 2, border_radius=25)
-        
-        # Back button text
-        back_font = pygame.font.Font(None, 32)
-        back_text = back_font.render('← Back', True, (255, 255, 255))
-        back_text_shadow = back_font.render('← Back', True, (0, 0, 0, 100))
-        
-        # Text shadow
-        self.screen.blit(back_text_shadow, (back_rect.centerx - back_text.get_width()//2 + 2, 
-                                          back_rect.centery - back_text.get_height()//2 + 2))
-        
-        # Main text
-        self.screen.blit(back_text, (back_rect.centerx - back_text.get_width()//2, 
-                                   back_rect.centery - back_text.get_height()//2))
+        self.screen.blit(self._back_button_surfs[back_hover], back_rect.topleft)
         
         # Store back button rect for click detection
         self.back_button_rect = back_rect
         
         # Instructions
-        instructions_font = pygame.font.Font(None, 24)
-        instructions = instructions_font.render('Select a level to begin', True, (200, 200, 220))
+        instructions = render_text('Select a level to begin', 24, (200, 200, 220))
         self.screen.blit(instructions, 
                         (SCREEN_WIDTH//2 - instructions.get_width()//2, 
                          container_y + container_height + 20))
     
+    def _bake_control_hint(self, text, hint_rect):
+        """Draw a control hint label on a copy of the shared hint background.
+        
+        Returns the surface and the screen position to blit it at.
+        """
+        surface = self._hint_bg.copy()
+        
+        # Draw the text
+        hint_text = render_text(text, 20, (220, 220, 240))
+        surface.blit(hint_text, (12, hint_rect.height // 2 - hint_text.get_height()//2))
+        
+        return surface, hint_rect.topleft
+    
     def render_game_play(self):
         # Render the level
         self.level_manager.render(self.screen)
@@ -753,136 +915,93 @@ class Game:
         if self.player:
             self.player.render(self.screen)
         
-        # Create a semi-transparent overlay for HUD
-        hud_surface = pygame.Surface((SCREEN_WIDTH, 80), pygame.SRCALPHA)
-        hud_surface.fill((20, 25, 35, 180))  # Semi-transparent dark blue
-        
-        # Add a subtle gradient to the HUD
-        for y in range(hud_surface.get_height()):
-            alpha = 180 - y // 2  # Gradient from top to bottom
-            pygame.draw.rect(hud_surface, (30, 35, 45, alpha), 
-                           (0, y, hud_surface.get_width(), 1))
-        
-        # Draw the HUD overlay
-        self.screen.blit(hud_surface, (0, 0))
-        
-        # Draw a subtle border at the bottom of the HUD
-        pygame.draw.line(self.screen, (80, 90, 120, 100), 
-                        (0, 80), (SCREEN_WIDTH, 80), 2)
-        
-        # Draw level indicator with icon
-        level_icon = pygame.Surface((40, 40), pygame.SRCALPHA)
-        pygame.draw.circle(level_icon, (100, 180, 255, 200), (20, 20), 16)  # Blue circle
-        font = pygame.font.Font(None, 24)
-        level_num = font.render(str(self.current_level), True, (255, 255, 255))
-        level_icon.blit(level_num, 
-                       (20 - level_num.get_width()//2, 
-                        20 - level_num.get_height()//2))
+        # The HUD is collected as (surface, pos) pairs and blitted in one batch,
+        # starting with the pre-baked overlay
+        hud_blits = [(self._hud_bg, (0, 0))]
+        
+        # Draw level indicator with icon, redrawn only when the level changes
+        if self._level_icon_level != self.current_level:
+            level_icon = pygame.Surface((40, 40), pygame.SRCALPHA).convert_alpha()
+            pygame.draw.circle(level_icon, (100, 180, 255, 200), (20, 20), 16)  # Blue circle
+            level_num = render_text(str(self.current_level), 24, (255, 255, 255))
+            level_icon.blit(level_num, 
+                           (20 - level_num.get_width()//2, 
+                            20 - level_num.get_height()//2))
+            self._level_icon = level_icon
+            self._level_icon_level = self.current_level
         
         # Position and draw the level indicator
         level_x = 25
         level_y = 20
-        self.screen.blit(level_icon, (level_x, level_y))
+        hud_blits.append((self._level_icon, (level_x, level_y)))
         
         # Draw lives with heart icons
         heart_icon = '❤️'  # Using text heart for simplicity
-        font = pygame.font.SysFont('Arial', 28, bold=True)
-        lives_text = font.render(f'×{self.lives}', True, (255, 100, 100))  # Red color for lives
         
         # Draw a heart icon next to lives
-        heart_surface = font.render('❤', True, (255, 100, 100))
-        self.screen.blit(heart_surface, (level_x + 60, level_y + 5))
-        self.screen.blit(lives_text, (level_x + 90, level_y + 8))
-        
-        # Draw score with a trophy icon
-        score_font = pygame.font.Font(None, 36)
-        score_text = score_font.render(f'{self.score:06d}', True, (255, 215, 0))  # Gold color for score
+        heart_surface = render_sysfont_text('❤', 'Arial', 28, (255, 100, 100), bold=True)
+        hud_blits.append((heart_surface, (level_x + 60, level_y + 5)))
+        hud_blits.extend(number_blits(self._lives_glyphs, f'×{self.lives}', level_x + 90, level_y + 8))  # Red color for lives
         
-        # Draw a small trophy icon (using text symbol for simplicity)
+        # Draw score with a trophy icon (using text symbol for simplicity)
         trophy_icon = '🏆'
-        trophy_surface = font.render('🏆', True, (255, 255, 255))
-        self.screen.blit(trophy_surface, (level_x + 200, level_y + 5))
-        self.screen.blit(score_text, (level_x + 235, level_y + 8))
+        trophy_surface = render_sysfont_text('🏆', 'Arial', 28, (255, 255, 255), bold=True)
+        hud_blits.append((trophy_surface, (level_x + 200, level_y + 5)))
+        hud_blits.extend(number_blits(self._score_glyphs, f'{self.score:06d}', level_x + 235, level_y + 8))  # Gold color for score
         
-        # Draw controls hint at the bottom
-        controls_font = pygame.font.Font(None, 20)
-        controls_text = [
-            '← → : Move',
-            '↑ / SPACE: Jump',
-            'R: Reset Level',
-            'ESC: Menu'
-        ]
-        
-        # Draw each control hint with an icon
-        control_x = SCREEN_WIDTH - 200
-        control_y = 15
-        control_spacing = 30
-        
-        for i, control in enumerate(controls_text):
-            # Draw a subtle background for each control hint
-            hint_surface = pygame.Surface((180, 25), pygame.SRCALPHA)
-            hint_surface.fill((255, 255, 255, 20))  # Semi-transparent white
-            
-            # Draw the hint text
-            hint_text = controls_font.render(control, True, (220, 220, 240))
-            
-            # Position and draw the hint
-            hint_rect = pygame.Rect(control_x, control_y + i * control_spacing, 180, 25)
-            
-            # Rounded rectangle background
-            pygame.draw.rect(self.screen, (40, 45, 60, 180), hint_rect, border_radius=12)
-            pygame.draw.rect(self.screen, (80, 90, 120, 150), hint_rect, 1, border_radius=12)
-            
-            # Draw the text
-            self.screen.blit(hint_text, (hint_rect.x + 12, hint_rect.centery - hint_text.get_height()//2))
+        # Draw the pre-composited control hints, skipping any outside the clip
+        clip = self.screen.get_clip()
+        hud_blits.extend(hint for hint, hint_rect in zip(self._hint_blits, self._hint_rects)
+                         if clip.colliderect(hint_rect))
         
-        # Add a subtle pulse effect to the HUD every few seconds
-        pulse = (pygame.time.get_ticks() % 5000) / 5000.0
-        pulse_alpha = int(30 * (1 + math.sin(pulse * math.pi * 2)) / 2)  # 0-30 alpha pulse
+        self.screen.blits(hud_blits, doreturn=False)
         
-        # Draw a subtle glow at the bottom of the HUD
-        glow_height = 10
-        for i in range(glow_height):
-            alpha = int(30 * (1 - i / glow_height))
-            pygame.draw.line(self.screen, (100, 180, 255, alpha), 
-                           (0, 80 + i), (SCREEN_WIDTH, 80 + i))
+        # Draw a glow strip at the bottom of the HUD (the screen has no
+        # alpha channel, so every row comes out the same solid colour)
+        self.screen.fill((100, 180, 255), (0, 80, SCREEN_WIDTH, 10))
     
     def render_game_over(self):
-        # Save high score
-        try:
-            with open('highscore.txt', 'r') as f:
-                high_score = int(f.read())
-        except (FileNotFoundError, ValueError):
-            high_score = 0
-            
-        if self.score > high_score:
-            high_score = self.score
-            with open('highscore.txt', 'w') as f:
-                f.write(str(high_score))
+        # The high score was read (and saved if beaten) on entering this state
+        high_score = self._high_score
         
         # Render game over screen
-        font = pygame.font.Font(None, 74)
-        text = font.render('Game Over', True, (255, 0, 0))
+        text = render_text('Game Over', 74, (255, 0, 0))
         self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, 150))
         
-        font = pygame.font.Font(None, 48)
-        score_text = font.render(f'Score: {self.score}', True, (255, 255, 255))
-        high_text = font.render(f'High Score: {high_score}', True, (255, 215, 0))
+        score_text = render_text(f'Score: {self.score}', 48, (255, 255, 255))
+        high_text = render_text(f'High Score: {high_score}', 48, (255, 215, 0))
         
         self.screen.blit(score_text, (SCREEN_WIDTH//2 - score_text.get_width()//2, 250))
         self.screen.blit(high_text, (SCREEN_WIDTH//2 - high_text.get_width()//2, 310))
         
-        font = pygame.font.Font(None, 36)
-        text = font.render('Press ENTER to return to menu', True, (200, 200, 200))
+        text = render_text('Press ENTER to return to menu', 36, (200, 200, 200))
         self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, 400))
     
     def run(self):
+        # Fixed timestep: the game advances FPS ticks per second of real
+        # time, and a frame is only drawn after at least one tick has run
+        tick_ms = 1000 / FPS
+        lag = 0.0
+        self.clock.tick()
         while self.running:
+            lag += self.clock.tick(FPS)
             self.handle_events()
-            self.update()
-            self.render()
-            self.clock.tick(FPS)
+            
+            ticks = 0
+            while lag >= tick_ms and ticks < MAX_TICKS_PER_FRAME and self.running:
+                self.update()
+                lag -= tick_ms
+                ticks += 1
+            
+            # Drop the backlog after a long stall instead of fast-forwarding
+            if ticks == MAX_TICKS_PER_FRAME:
+                lag = min(lag, tick_ms)
+            
+            if ticks:
+                self.render()
         
+        if self.player:
+            self.player.flush_customization()
         pygame.quit()
         sys.exit()
 
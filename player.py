@@ -3,8 +3,60 @@ import pygame
 import math
 import json
 from config import SCREEN_WIDTH, SCREEN_HEIGHT, GRAVITY
+from file_utils import atomic_write_text
+
+def resolve_platform_collisions(x, y, vel_x, vel_y, radius, bounce_factor, platforms):
+    """Push a ball out of every platform it overlaps, in order.
+    
+    Works on plain numbers so the per-platform loop touches no attributes.
+    
+    Args:
+        x, y, vel_x, vel_y: Ball position and velocity
+        radius: Ball radius
+        bounce_factor: Fraction of vertical speed kept when landing on a top
+        platforms: Iterable of (left, top, right, bottom) platform bounds
+    
+    Returns:
+        (x, y, vel_x, vel_y, on_ground) after all collisions
+    """
+    on_ground = False
+    radius_sq = radius * radius
+    for left, top, right, bottom in platforms:
+        # Get closest point on platform to circle
+        closest_x = max(left, min(x, right))
+        closest_y = max(top, min(y, bottom))
+        
+        # Compare squared distances, so no square root is needed
+        dx = x - closest_x
+        dy = y - closest_y
+        
+        if dx * dx + dy * dy <= radius_sq:
+            # Collision detected
+            if closest_y == top:  # Top collision
+                y = top - radius
+                vel_y = -vel_y * bounce_factor
+                on_ground = True
+            elif closest_y == bottom:  # Bottom collision
+                y = bottom + radius
+                vel_y = -vel_y * 0.5
+            elif closest_x == left:  # Left collision
+                x = left - radius
+                vel_x *= -0.5
+            else:  # Right collision
+                x = right + radius
+                vel_x *= -0.5
+    return x, y, vel_x, vel_y, on_ground
 
 class PlayerBall:
+    # Attributes saved to and loaded from the customization file
+    CUSTOMIZATION_FIELDS = ('color', 'size', 'texture', 'bounce_factor', 'opacity',
+                            'glow', 'glow_color', 'glow_size', 'pattern_color')
+    
+    __slots__ = ('x', 'y', 'vel_x', 'vel_y', 'on_ground',
+                 'max_vel_x', 'acceleration', 'friction',
+                 '_ball_surfaces', '_spare_ball_surfaces', '_glow_surfaces', '_ball_surface_dirty',
+                 '_customization_dirty') + CUSTOMIZATION_FIELDS
+    
     def __init__(self, x=SCREEN_WIDTH // 2, y=100):
         # Position and movement
         self.x = x
@@ -14,17 +66,25 @@ class PlayerBall:
         self.on_ground = False
         
         # Customization defaults
-        self.customization = {
-            'color': (255, 0, 0),  # Default red
-            'size': 20,            # Default radius (10-40)
-            'texture': 'solid',    # 'solid', 'striped', 'gradient', 'polka'
-            'bounce_factor': 0.7,  # Bounce dampening (0.1-1.0)
-            'opacity': 255,        # 0-255
-            'glow': False,         # Glow effect
-            'glow_color': (255, 255, 200),  # Soft white glow
-            'glow_size': 1.5,      # Glow size multiplier
-            'pattern_color': (255, 255, 255)  # Secondary color for patterns
-        }
+        self.color = (255, 0, 0)           # Default red
+        self.size = 20                     # Default radius (10-40)
+        self.texture = 'solid'             # 'solid', 'striped', 'gradient', 'polka'
+        self.bounce_factor = 0.7           # Bounce dampening (0.1-1.0)
+        self.opacity = 255                 # 0-255
+        self.glow = False                  # Glow effect
+        self.glow_color = (255, 255, 200)  # Soft white glow
+        self.glow_size = 1.5               # Glow size multiplier
+        self.pattern_color = (255, 255, 255)  # Secondary color for patterns
+        
+        # Ball and glow surfaces by radius, rebuilt after a look change
+        self._ball_surfaces = {}
+        self._glow_surfaces = {}
+        # Ball surfaces from before the last look change, redrawn instead of reallocated
+        self._spare_ball_surfaces = {}
+        self._ball_surface_dirty = True
+        
+        # Setters only mark the settings as changed; flush_customization saves them
+        self._customization_dirty = False
         
         # Load saved customization if available
         self.load_customization()
@@ -39,24 +99,41 @@ class PlayerBall:
         try:
             with open(filename, 'r') as f:
                 saved = json.load(f)
-                self.customization.update(saved)
+                for key in self.CUSTOMIZATION_FIELDS:
+                    if key in saved:
+                        setattr(self, key, saved[key])
                 # Convert color from list to tuple if needed
-                if isinstance(self.customization['color'], list):
-                    self.customization['color'] = tuple(self.customization['color'])
+                if isinstance(self.color, list):
+                    self.color = tuple(self.color)
+                self._ball_surface_dirty = True
         except (FileNotFoundError, json.JSONDecodeError):
             # Use defaults if file doesn't exist or is invalid
             pass
     
+    @property
+    def customization(self):
+        """The customization settings as a new dict, in the saved-file layout."""
+        return {key: getattr(self, key) for key in self.CUSTOMIZATION_FIELDS}
+    
     def save_customization(self, filename='customization.json'):
-        """Save current customization to file."""
-        with open(filename, 'w') as f:
-            json.dump(self.customization, f)
+        """Save current customization to file.
+        
+        The settings go to a temporary file that then replaces the old one,
+        so an interrupted save never leaves a truncated file behind.
+        """
+        atomic_write_text(filename, json.dumps(self.customization, separators=(',', ':')))
+        self._customization_dirty = False
+    
+    def flush_customization(self):
+        """Save the customization if a setter changed it since the last save."""
+        if self._customization_dirty:
+            self.save_customization()
     
     def update(self, platforms=None, in_water=False):
         """Update player position and handle collisions.
         
         Args:
-            platforms: List of platform objects to check for collisions
+            platforms: List of (left, top, right, bottom) platform bounds to check
             in_water: Boolean indicating if player is in water (affects physics)
         """
         if platforms is None:
@@ -75,12 +152,11 @@ class PlayerBall:
         self.y += self.vel_y
         
         # Check for collisions with platforms
-        self.on_ground = False
-        for platform in platforms:
-            self.check_collision(platform)
+        self.x, self.y, self.vel_x, self.vel_y, self.on_ground = resolve_platform_collisions(
+            self.x, self.y, self.vel_x, self.vel_y, self.size, self.bounce_factor, platforms)
         
         # Screen boundaries
-        radius = self.customization['size']
+        radius = self.size
         if self.x < radius:
             self.x = radius
             self.vel_x *= -0.5
@@ -93,9 +169,17 @@ class PlayerBall:
             self.vel_y = 0
         elif self.y > SCREEN_HEIGHT - radius:
             self.y = SCREEN_HEIGHT - radius
-            self.vel_y = -self.vel_y * self.customization['bounce_factor']
+            self.vel_y = -self.vel_y * self.bounce_factor
             self.on_ground = True
     
+    def sweep_rect(self):
+        """Return the (x, y, width, height) area the next update can reach.
+        
+        Used to ask the level for nearby platforms only.
+        """
+        reach = self.size * 2 + abs(self.vel_x) + abs(self.vel_y) + GRAVITY
+        return (self.x - reach, self.y - reach, reach * 2, reach * 2)
+    
     def move_left(self):
         """Move the ball left."""
         if abs(self.vel_x) < self.max_vel_x:
@@ -112,163 +196,157 @@ class PlayerBall:
             self.vel_y = -15  # Jump strength
             self.on_ground = False
     
-    def check_collision(self, platform):
-        """Check and handle collision with a platform."""
-        radius = self.customization['size']
-        
-        # Get closest point on platform to circle
-        closest_x = max(platform['x'], min(self.x, platform['x'] + platform['width']))
-        closest_y = max(platform['y'], min(self.y, platform['y'] + platform['height']))
-        
-        # Calculate distance between closest point and circle center
-        distance = math.sqrt((self.x - closest_x)**2 + (self.y - closest_y)**2)
-        
-        if distance <= radius:
-            # Collision detected
-            if closest_y == platform['y']:  # Top collision
-                self.y = platform['y'] - radius
-                self.vel_y = -self.vel_y * self.customization['bounce_factor']
-                self.on_ground = True
-            elif closest_y == platform['y'] + platform['height']:  # Bottom collision
-                self.y = platform['y'] + platform['height'] + radius
-                self.vel_y = -self.vel_y * 0.5
-            elif closest_x == platform['x']:  # Left collision
-                self.x = platform['x'] - radius
-                self.vel_x *= -0.5
-            else:  # Right collision
-                self.x = platform['x'] + platform['width'] + radius
-                self.vel_x *= -0.5
-    
-    def move_left(self):
-        """Move the ball left."""
-        if abs(self.vel_x) < self.max_vel_x:
-            self.vel_x -= self.acceleration
-    
-    def move_right(self):
-        """Move the ball right."""
-        if abs(self.vel_x) < self.max_vel_x:
-            self.vel_x += self.acceleration
-    
-        """Make the ball jump if on ground."""
-        if self.on_ground:
-            self.vel_y = -12  # Jump strength
-            self.on_ground = False
+    def _build_glow_surface(self, glow_radius):
+        """Draw the three soft glow rings of the given radius onto a new surface."""
+        glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA).convert_alpha()
+        for i in range(3):
+            alpha = 100 - (i * 25)
+            if alpha > 0:
+                pygame.draw.circle(
+                    glow_surface, 
+                    (*self.glow_color, alpha),
+                    (glow_radius, glow_radius),
+                    glow_radius - (i * 3)
+                )
+        return glow_surface
     
-    def render(self, surface, is_preview=False):
-        """Draw the player on the given surface.
-        
-        Args:
-            surface: The surface to draw on
-            is_preview: If True, renders with preview-specific settings
-        """
-        radius = self.customization['size']
-        x, y = int(self.x), int(self.y)
-        
-        # Create a surface for the ball to handle transparency
-        ball_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-        
-        # Draw glow effect if enabled
-        if self.customization['glow'] and not is_preview:
-            glow_radius = int(radius * self.customization['glow_size'])
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            for i in range(3):
-                alpha = 100 - (i * 25)
-                if alpha > 0:
-                    pygame.draw.circle(
-                        glow_surface, 
-                        (*self.customization['glow_color'], alpha),
-                        (glow_radius, glow_radius),
-                        glow_radius - (i * 3)
-                    )
-            surface.blit(glow_surface, (x - glow_radius, y - glow_radius), special_flags=pygame.BLEND_ADD)
+    def _build_ball_surface(self, radius):
+        """Draw the textured ball of the given radius onto a blank surface."""
+        # Create a surface for the ball to handle transparency, or clear and
+        # reuse the one this radius had before the look changed
+        ball_surface = self._spare_ball_surfaces.pop(radius, None)
+        if ball_surface is None:
+            ball_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA).convert_alpha()
+        else:
+            ball_surface.fill((0, 0, 0, 0))
         
         # Draw the ball based on texture type
-        if self.customization['texture'] == 'striped':
+        if self.texture == 'striped':
             # Striped pattern
-            pygame.draw.circle(ball_surface, (*self.customization['color'], self.customization['opacity']), 
+            pygame.draw.circle(ball_surface, (*self.color, self.opacity), 
                              (radius, radius), radius)
             # Add stripes
             stripe_width = max(2, radius // 5)
             for i in range(-radius, radius, stripe_width * 2):
                 pygame.draw.line(
                     ball_surface, 
-                    (*[min(c + 40, 255) for c in self.customization['color']], self.customization['opacity']),
+                    (*[min(c + 40, 255) for c in self.color], self.opacity),
                     (0, radius + i),
                     (radius * 2, radius + i),
                     stripe_width
                 )
-        elif self.customization['texture'] == 'gradient':
-            # Gradient effect
+        elif self.texture == 'gradient':
+            # Gradient effect: each inner ring is 2 shades darker
+            red, green, blue = self.color
+            opacity = self.opacity
+            center = (radius, radius)
             for r in range(radius, 0, -1):
-                color = [max(0, c - (radius - r) * 2) for c in self.customization['color']]
-                alpha = min(255, self.customization['opacity'] * r // radius + 50)
-                pygame.draw.circle(ball_surface, (*color, alpha), (radius, radius), r)
-        elif self.customization['texture'] == 'polka':
+                shade = (radius - r) * 2
+                alpha = min(255, opacity * r // radius + 50)
+                pygame.draw.circle(ball_surface,
+                                 (max(0, red - shade), max(0, green - shade), max(0, blue - shade), alpha),
+                                 center, r)
+        elif self.texture == 'polka':
             # Polka dot pattern
-            pygame.draw.circle(ball_surface, (*self.customization['color'], self.customization['opacity']), 
+            pygame.draw.circle(ball_surface, (*self.color, self.opacity), 
                              (radius, radius), radius)
             dot_size = max(2, radius // 5)
             for i in range(0, 360, 45):
                 dot_x = radius + int((radius - dot_size) * math.cos(math.radians(i)))
                 dot_y = radius + int((radius - dot_size) * math.sin(math.radians(i)))
                 pygame.draw.circle(ball_surface, 
-                                 (*self.customization['pattern_color'], self.customization['opacity']),
+                                 (*self.pattern_color, self.opacity),
                                  (dot_x, dot_y), dot_size)
         else:  # solid
-            pygame.draw.circle(ball_surface, (*self.customization['color'], self.customization['opacity']), 
+            pygame.draw.circle(ball_surface, (*self.color, self.opacity), 
                              (radius, radius), radius)
         
+        return ball_surface
+    
+    def render(self, surface, is_preview=False):
+        """Draw the player on the given surface.
+        
+        Args:
+            surface: The surface to draw on
+            is_preview: If True, renders with preview-specific settings
+        """
+        radius = self.size
+        x, y = int(self.x), int(self.y)
+        
+        # Reuse the surfaces built for this radius, unless the look changed
+        if self._ball_surface_dirty:
+            self._spare_ball_surfaces.update(self._ball_surfaces)
+            self._ball_surfaces.clear()
+            self._glow_surfaces.clear()
+            self._ball_surface_dirty = False
+        
+        # Draw glow effect if enabled
+        if self.glow and not is_preview:
+            glow_radius = int(radius * self.glow_size)
+            glow_surface = self._glow_surfaces.get(glow_radius)
+            if glow_surface is None:
+                glow_surface = self._glow_surfaces[glow_radius] = self._build_glow_surface(glow_radius)
+            surface.blit(glow_surface, (x - glow_radius, y - glow_radius), special_flags=pygame.BLEND_ADD)
+        
+        ball_surface = self._ball_surfaces.get(radius)
+        if ball_surface is None:
+            ball_surface = self._ball_surfaces[radius] = self._build_ball_surface(radius)
+        
         # Draw the ball onto the main surface
         surface.blit(ball_surface, (x - radius, y - radius), special_flags=pygame.BLEND_ALPHA_SDL2)
     
     def set_color(self, color):
         """Set the ball's primary color."""
-        self.customization['color'] = color
-        self.save_customization()
+        self.color = color
+        self._ball_surface_dirty = True
+        self._customization_dirty = True
     
     def set_pattern_color(self, color):
         """Set the ball's secondary color for patterns."""
-        self.customization['pattern_color'] = color
-        self.save_customization()
+        self.pattern_color = color
+        self._ball_surface_dirty = True
+        self._customization_dirty = True
     
     def set_size(self, size):
         """Set the ball's size (radius)."""
-        self.customization['size'] = max(10, min(50, int(size)))
-        self.save_customization()
+        self.size = max(10, min(50, int(size)))
+        self._customization_dirty = True
     
     def set_bounce(self, factor):
         """Set the ball's bounce factor (0.1 to 1.0)."""
-        self.customization['bounce_factor'] = max(0.1, min(1.0, float(factor)))
-        self.save_customization()
+        self.bounce_factor = max(0.1, min(1.0, float(factor)))
+        self._customization_dirty = True
     
     def set_opacity(self, value):
         """Set the ball's opacity (0-255)."""
-        self.customization['opacity'] = max(0, min(255, int(value)))
-        self.save_customization()
+        self.opacity = max(0, min(255, int(value)))
+        self._ball_surface_dirty = True
+        self._customization_dirty = True
     
     def set_texture(self, texture):
         """Set the ball's texture type."""
         if texture in ['solid', 'striped', 'gradient', 'polka']:
-            self.customization['texture'] = texture
-            self.save_customization()
+            self.texture = texture
+            self._ball_surface_dirty = True
+            self._customization_dirty = True
     
     def toggle_glow(self):
         """Toggle the glow effect on/off."""
-        self.customization['glow'] = not self.customization['glow']
-        self.save_customization()
+        self.glow = not self.glow
+        self._customization_dirty = True
     
     def set_glow_size(self, size):
         """Set the glow size multiplier (1.0 to 2.5)."""
-        self.customization['glow_size'] = max(1.0, min(2.5, float(size)))
-        self.save_customization()
+        self.glow_size = max(1.0, min(2.5, float(size)))
+        self._customization_dirty = True
     
     def next_texture(self):
         """Cycle to the next texture option."""
         textures = ['solid', 'striped', 'gradient', 'polka']
-        current_idx = textures.index(self.customization['texture'])
+        current_idx = textures.index(self.texture)
         next_idx = (current_idx + 1) % len(textures)
         self.set_texture(textures[next_idx])
     
     def get_customization(self):
         """Return a copy of the current customization settings."""
-        return self.customization.copy()
+        return self.customization